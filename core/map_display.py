@@ -10,10 +10,12 @@ and managing UI elements using PySimpleGUI and Tkinter.
 from __future__ import annotations
 
 import FreeSimpleGUI as sg
+import math
 import os
 import threading
 import tkinter as tk
 
+from collections import OrderedDict
 from PIL import Image, ImageDraw, ImageFont, ImageTk
 from sys import exit
 from . import MapHandler, MapPainter, EUColors, EUWorldData
@@ -50,8 +52,21 @@ class MapDisplayer:
         handler (MapHandler): The event handler for managing interactions.
         image_id (int): The ID of the displayed image in the canvas.
         original_map (PIL.Image): The original unscaled backend map image.
-        map_image (PIL.Image): The currently displayed backedn map image.
+        map_pyramid (list[PIL.Image]): Successively halved copies of `original_map`, largest first,
+            used as cheaper sources when scaling the map down.
+        map_image (PIL.Image|None): The currently displayed backedn map image. None while a scaling
+            from `scaled_map_cache` is displayed, as only its Tkinter image is kept.
+        viewport_map_size (tuple[int, int]|None): The size of the scaled map while only its visible part
+            is displayed, otherwise None.
         tk_image (tk.PhotoImage): The Tkinter-compatible image for displaying.
+        scaled_map_cache (OrderedDict[tuple[int, int], tk.PhotoImage]): The Tkinter images of recently
+            displayed full quality scalings of `original_map`, by size.
+        scaled_map_cache_pixels (int): The maximum total number of pixels kept in `scaled_map_cache`.
+            Scalings larger than this on their own are not cached.
+        viewport_tk_image (tk.PhotoImage|None): The Tkinter image reused for displaying the visible part
+            of the map while zooming.
+        canvas_tk_image (tk.PhotoImage|None): The Tkinter image reused by `update_canvas` for the map
+            fitted to the canvas, such as after a map mode change.
         tk_canvas (tk.Canvas): The window's canvas for the displaying the current image.
         window (sg.Window): The PySimpleGUI window for the UI.
 
@@ -76,8 +91,15 @@ class MapDisplayer:
         self.handler: MapHandler = None
         self.image_id = None
         self.original_map = None
+        self.map_pyramid: list[Image.Image] = []
         self.map_image = None
+        self.viewport_map_size: tuple[int, int] = None
         self.tk_image = None
+        self.scaled_map_cache: OrderedDict[tuple[int, int], ImageTk.PhotoImage] = OrderedDict()
+        # Tkinter stores 4 bytes per pixel, so this keeps at most about 200 MB.
+        self.scaled_map_cache_pixels = 50_000_000
+        self.viewport_tk_image: ImageTk.PhotoImage = None
+        self.canvas_tk_image: ImageTk.PhotoImage = None
         self.tk_canvas = None
         self.window = None
 
@@ -119,25 +141,157 @@ class MapDisplayer:
         """Converts a PIL Image to a TkInter Image."""
         return ImageTk.PhotoImage(image)
 
-    def scale_image_to_fit(self, image: Image.Image):
-        """Scales the map to fit within the canvas.
+    def set_original_map(self, image: Image.Image, min_pyramid_width: int=512):
+        """Sets the unscaled map image and builds its downsampling pyramid.
+
+        Each pyramid level is half the size of the previous one, until the width drops
+        below `min_pyramid_width`. Levels are built with `Image.reduce`, a 2x2 box average
+        that is several times faster than a BOX resize. This costs roughly a third more memory
+        than the image itself.
+
+        Args:
+            image (Image): The new unscaled map image.
+            min_pyramid_width (int, optional): The width under which no more levels are built.
+        """
+        self.original_map = image
+        self.map_pyramid = [image]
+        self.scaled_map_cache.clear()
+
+        level = image
+        while level.width > min_pyramid_width:
+            level = level.reduce(2)
+            self.map_pyramid.append(level)
+
+    def resize_map(self, size: tuple[int, int], resample: Image.Resampling=Image.Resampling.LANCZOS):
+        """Resizes the original map, starting from the smallest pyramid level that is
+        still at least twice the target width.
+
+        Args:
+            size (tuple[int, int]): The `(width, height)` to resize to.
+            resample (Image.Resampling, optional): The resampling filter to use.
+
+        Returns:
+            Image: The resized map.
+        """
+        source = self._get_pyramid_level(size[0])
+        return source.resize(size, resample)
+
+    def _get_pyramid_level(self, width: int):
+        """Gets the smallest pyramid level that is still at least twice the given width.
+
+        Args:
+            width (int): The width that will be resized to.
+
+        Returns:
+            Image: The pyramid level, or `original_map` if none are large enough.
+        """
+        target_width = width * 2
+        if target_width >= self.original_map.width:
+            return self.original_map
+
+        index = min(int(math.log2(self.original_map.width / target_width)), len(self.map_pyramid) - 1)
+        while index and self.map_pyramid[index].width < target_width:
+            index -= 1
+
+        return self.map_pyramid[index]
+
+    @property
+    def map_size(self):
+        """The `(width, height)` of the scaled map, also while only its visible part is displayed."""
+        return self.viewport_map_size or (self.tk_image.width(), self.tk_image.height())
+
+    def scale_image_to_fit(self):
+        """Scales the original map to fit within the canvas.
         
         Sets the new size of the map and also sets the minimum and maximum zoom levels.
         
-        Args:
-            image (Image): The image to scale.
-        
         Returns:
             Image: The scaled image.
         """
-        width, height = image.size
+        width, height = self.original_map.size
         canvas_width, canvas_height = self.canvas_size
 
         self.map_scale = min(canvas_width / width, canvas_height / height)
         self.max_scale = 10 * self.map_scale
         self.min_scale = self.map_scale
 
-        return image.resize((self.canvas_size), Image.Resampling.LANCZOS)
+        return self.resize_map(self.canvas_size)
+
+    def show_scaled_map(
+        self,
+        size: tuple[int, int],
+        resample: Image.Resampling=Image.Resampling.LANCZOS,
+        cache: bool=False):
+        """Resizes the original map and displays it on the canvas.
+
+        Scalings stored with `cache` are reused when the map is shown at the same size again, 
+        skipping both the resize and the conversion to a Tkinter image.
+
+        Args:
+            size (tuple[int, int]): The `(width, height)` to display the map at.
+            resample (Image.Resampling, optional): The resampling filter to use.
+            cache (bool, optional): If the result should be stored in `scaled_map_cache`.
+
+        Returns:
+            bool: If the displayed image was taken from the cache.
+        """
+        tk_image = self.scaled_map_cache.get(size)
+        if tk_image is not None:
+            self.scaled_map_cache.move_to_end(size)
+            self.map_image = None
+            self.update_canvas(tk_image=tk_image)
+            return True
+
+        self.map_image = self.resize_map(size, resample)
+        tk_image = self.image_to_tkimage(self.map_image)
+        width, height = size
+        if cache and width * height <= self.scaled_map_cache_pixels:
+            self.scaled_map_cache[size] = tk_image
+            while sum(w * h for w, h in self.scaled_map_cache) > self.scaled_map_cache_pixels:
+                self.scaled_map_cache.popitem(last=False)
+
+        self.update_canvas(tk_image=tk_image)
+        return False
+
+    def show_map_viewport(self, size: tuple[int, int], resample: Image.Resampling=Image.Resampling.BILINEAR):
+        """Displays only the part of the original map scaled to `size` that is visible on the canvas.
+
+        Only a canvas sized image is resampled and converted for Tkinter, no matter how far the map 
+        is zoomed in. The image is placed at the canvas origin so it cannot be panned, the full 
+        scaling must be shown with `show_scaled_map` first.
+
+        Args:
+            size (tuple[int, int]): The `(width, height)` of the scaled map.
+            resample (Image.Resampling, optional): The resampling filter to use.
+        """
+        width, height = size
+        canvas_width, canvas_height = self.canvas_size
+        view_width = min(canvas_width, width)
+        view_height = min(canvas_height, height)
+
+        source = self._get_pyramid_level(width)
+        scale_x = source.width / width
+        scale_y = source.height / height
+        left = -self.offset_x * scale_x
+        top = -self.offset_y * scale_y
+        box = (left, top, left + view_width * scale_x, top + view_height * scale_y)
+
+        self.map_image = source.resize((view_width, view_height), resample, box=box)
+
+        # Write into the same Tkinter image on every zoom step instead of allocating a new one.
+        viewport_tk_image = self.viewport_tk_image
+        if viewport_tk_image is None or (viewport_tk_image.width(), viewport_tk_image.height()) != self.map_image.size:
+            viewport_tk_image = self.image_to_tkimage(self.map_image)
+            self.viewport_tk_image = viewport_tk_image
+        else:
+            viewport_tk_image.paste(self.map_image)
+
+        self.tk_image = viewport_tk_image
+        self.tk_canvas.itemconfig(self.image_id, image=self.tk_image)
+        self.tk_canvas.coords(self.image_id, 0, 0)
+        self.viewport_map_size = size
+
+        self.window.refresh()
 
     def display_loading_screen(
         self,
@@ -174,8 +328,9 @@ class MapDisplayer:
         text_center_y = (canvas_size[1] - text_height) // 2
         draw.text((text_center_x, text_center_y), text=message, fill="white", font=font)
 
+        # Converted separately, so that `canvas_tk_image` keeps the size of the fitted map.
         self.map_image = map_image
-        self.update_canvas(offset_x=0, offset_y=0)
+        self.update_canvas(offset_x=0, offset_y=0, tk_image=self.image_to_tkimage(map_image))
 
         self.window.refresh()
 
@@ -190,17 +345,40 @@ class MapDisplayer:
             if isinstance(element, sg.Input):
                 element.update(value="")
 
-    def update_canvas(self, offset_x: int=None, offset_y: int=None):
+    def update_canvas(self, offset_x: int=None, offset_y: int=None, tk_image: ImageTk.PhotoImage=None):
         """Updates the canvas by applying all pan and/or zoom adjustments to the image.
         
         This is done after every zoom and pan event, or after changing the map mode or selected savefile.
+
+        Args:
+            offset_x (int, optional): The x offset to place the image at. Defaults to `offset_x`.
+            offset_y (int, optional): The y offset to place the image at. Defaults to `offset_y`.
+            tk_image (PhotoImage, optional): An already converted image of `map_image` to display.
         """
         if offset_x == None:
             offset_x = self.offset_x
         if offset_y == None:
             offset_y = self.offset_y
 
-        self.tk_image = self.image_to_tkimage(self.map_image)
+        if tk_image is None:
+            if self.map_image.size == self.canvas_size:
+                # Write the fitted map into the same Tkinter image, as after a map mode change.
+                tk_image = self.canvas_tk_image
+                if tk_image is None or (tk_image.width(), tk_image.height()) != self.canvas_size:
+                    tk_image = self.image_to_tkimage(self.map_image)
+                    self.canvas_tk_image = tk_image
+                else:
+                    tk_image.paste(self.map_image)
+            else:
+                # Zoomed maps can be very large, so they are not kept once replaced.
+                tk_image = self.image_to_tkimage(self.map_image)
+
+        # A pending full quality zoom pass would redraw the previous map over this image.
+        if self.handler:
+            self.handler.cancel_zoom_settle()
+
+        self.tk_image = tk_image
+        self.viewport_map_size = None
         self.tk_canvas.itemconfig(self.image_id, image=self.tk_image)
         self.tk_canvas.coords(self.image_id, offset_x, offset_y)
 
@@ -210,7 +388,7 @@ class MapDisplayer:
         """Resets the canvas to its initial zoom and pan settings."""
         self.offset_x = 0
         self.offset_y = 0
-        self.map_image = self.scale_image_to_fit(self.original_map)
+        self.map_image = self.scale_image_to_fit()
 
         self.update_canvas()
 
@@ -219,8 +397,7 @@ class MapDisplayer:
         
         Draws the map for the new savefile and calls `rest_canvas_to_inital` to reset pan and zoom.
         """
-        self.original_map = self.painter.get_cached_map_image(borders=self.show_map_borders)
-        self.map_image = self.scale_image_to_fit(self.original_map)
+        self.set_original_map(self.painter.get_cached_map_image(borders=self.show_map_borders))
         self.reset_canvas_to_initial()
 
     def update_details_from_selected_item(self, selected_item: EUMapEntity):
@@ -624,6 +801,7 @@ class MapDisplayer:
         self.painter.set_base_world_image(image=self.world_data.world_image)
 
         self.refresh_canvas()
+        self.painter.precompute_map_modes()
         self.window["POLITICAL"].update(button_color=(constants.LIGHT_TEXT, constants.SELECTED_BUTTON_BG))
         self.window["-SAVEFILE_DATE-"].update(value=f"The World in {self.world_data.current_save_date}")
 
@@ -633,7 +811,9 @@ class MapDisplayer:
     def handle_save_loaded(self):
         """Handles map reloading when a new save file is loaded."""
         self.painter.clear_cache()
+        self.handler.clear_hover_cache()
         self.refresh_canvas()
+        self.painter.precompute_map_modes()
 
         self.window["-SAVEFILE_DATE-"].update(value=f"The World in {self.world_data.current_save_date}")
         self.send_message_callback("Save loaded!")
@@ -645,6 +825,8 @@ class MapDisplayer:
         new_savefile = sg.popup_get_file("Select a savefile to load", file_types=(("EU4 Save", "*.eu4"),))
         if new_savefile:
             self.handler.disabled = True
+            # The world is rebuilt in place, so no background draw may still be reading it.
+            self.painter.cancel_precompute()
 
             self.clear_ui_window()
             self.send_message_callback(rf"Loading new savefile: {new_savefile}....")
@@ -659,8 +841,8 @@ class MapDisplayer:
     def handle_border_toggle(self, values):
         """Toggles displaying map borders."""
         self.show_map_borders = values["-SHOW_MAP_BORDERS-"]
-        self.original_map = self.painter.get_cached_map_image(borders=self.show_map_borders)
-        self.map_image = self.original_map.resize(self.map_image.size, Image.Resampling.LANCZOS)
+        self.set_original_map(self.painter.get_cached_map_image(borders=self.show_map_borders))
+        self.map_image = self.resize_map(self.map_size)
         self.update_canvas()
 
     def handle_map_mode_change(self, map_modes: dict[str, MapMode], new_map_mode: MapMode):
@@ -677,8 +859,7 @@ class MapDisplayer:
         self.display_loading_screen(message="Loading map....")
 
         self.painter.map_mode = new_map_mode
-        self.original_map = self.painter.get_cached_map_image(borders=self.show_map_borders)
-        self.map_image = self.original_map.resize(self.map_image.size, Image.Resampling.LANCZOS)
+        self.set_original_map(self.painter.get_cached_map_image(borders=self.show_map_borders))
 
         self.send_message_callback(f"Displaying map {self.painter.map_mode.value.capitalize()}")
         self.color_map_mode_buttons(map_modes)
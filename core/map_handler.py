@@ -19,6 +19,7 @@ user interactions and ensure smooth map navigation.
 
 from __future__ import annotations
 
+import time
 import tkinter as tk
 
 from PIL import Image
@@ -46,15 +47,34 @@ class MapHandler:
         disabled (bool): If the handler is disabled, should respond to events or not.
 
         pan_animation_id (int or None): The identifier for the pan animation, if active.
+        pan_duration (float): The duration in seconds of the pan animation.
         cursor_movement (float): The total distance moved by the cursor while dragging.
         dragging (bool): Flag indicating whether the user is currently dragging the map.
         prev_x (int): The previous x-coordinate of the cursor during dragging.
         prev_y (int): The previous y-coordinate of the cursor during dragging.
         start_x (int): The starting x-coordinate of the cursor during dragging.
         start_y (int): The starting y-coordinate of the cursor during dragging.
+        drag_delay (int): The delay in milliseconds during which drag events are collected
+            before the map is moved once.
+        _drag_flush_id (str|None): The identifier for the scheduled map move, if any.
 
         scale_factor (float): The factor by which the map scales during zooming operations.
-        zooming (bool): Flag indicating whether a zoom operation is currently in progress.
+        zoom_settle_delay (int): The delay in milliseconds after the last zoom before the
+            map is resampled at full quality.
+        _pending_zoom_steps (int): The net number of scroll steps not yet applied, positive
+            for zooming in.
+        _zoom_cursor (tuple[int, int]): The canvas position of the cursor for the last scroll event.
+        _zoom_flush_id (str|None): The identifier for the scheduled zoom, if any.
+        _zoom_settle_id (str|None): The identifier for the scheduled full quality pass, if any.
+
+        hover_delay (int): The delay in milliseconds during which motion events are collected
+            before the hover information is updated once.
+        _hover_cursor (tuple[int, int]): The canvas position of the cursor for the last motion event.
+        _hover_flush_id (str|None): The identifier for the scheduled hover update, if any.
+        _hover_text_cache (dict[tuple[int, MapMode], str|None]): The hover text already built for 
+            each province and map mode.
+        _last_hover (tuple[int, MapMode]|None): The province ID and map mode of the hover text 
+            currently displayed.
     """
     def __init__(self, displayer: MapDisplayer, tk_canvas: tk.Canvas, disabled: bool=False):
         self.displayer = displayer
@@ -64,15 +84,28 @@ class MapHandler:
         self.disabled = disabled
 
         self.pan_animation_id = None
+        self.pan_duration = 0.25
         self.cursor_movement = 0
         self.dragging = False
         self.prev_x = 0
         self.prev_y = 0
         self.start_x = 0
         self.start_y = 0
+        self.drag_delay = 16
+        self._drag_flush_id = None
 
         self.scale_factor = 1.1
-        self.zooming = False
+        self._pending_zoom_steps = 0
+        self._zoom_cursor = (0, 0)
+        self._zoom_flush_id = None
+        self.zoom_settle_delay = 150
+        self._zoom_settle_id = None
+
+        self.hover_delay = 16
+        self._hover_cursor = (0, 0)
+        self._hover_flush_id = None
+        self._hover_text_cache: dict[tuple[int, MapMode], str|None] = {}
+        self._last_hover: tuple[int, MapMode]|None = None
 
     def bind_events(self):
         """Binds events to `self.tk_canvas` for event handling."""
@@ -85,6 +118,8 @@ class MapHandler:
         self.tk_canvas.bind("<Button-4>", self._on_zoom)
         self.tk_canvas.bind("<Button-5>", self._on_zoom)
 
+        self.tk_canvas.bind("<Configure>", self._on_configure)
+
     def clamp_offsets(self, target_offset_x: int=None, target_offset_y: int=None):
         """Restricts the map's position within valid bounds to prevent it from moving out of view.
 
@@ -101,7 +136,7 @@ class MapHandler:
                 Otherwise, updates `displayer.offset_x` and `displayer.offset_y` directly.
         """
         displayer = self.displayer
-        map_width, map_height = displayer.map_image.size
+        map_width, map_height = displayer.map_size
         canvas_width, canvas_height = displayer.canvas_size
 
         max_x = 0
@@ -118,6 +153,11 @@ class MapHandler:
             displayer.offset_x = max(min_x, min(displayer.offset_x, max_x))
             displayer.offset_y = max(min_y, min(displayer.offset_y, max_y))
 
+    def clear_hover_cache(self):
+        """Clears the cached hover text, needed whenever the world data changes."""
+        self._hover_text_cache.clear()
+        self._last_hover = None
+
     def canvas_to_image_coords(self, canvas_x: int|float, canvas_y: int|float):
         """Converts canvas coordinates to image coordinates using the current map scale.
         
@@ -136,6 +176,8 @@ class MapHandler:
 
     def get_province_at(self, image_x: int, image_y: int):
         """Gets the province at the given `(x, y)` location on the map.
+
+        Reads the province ID from the world's province ID map, a constant time lookup.
         
         Args:
             image_x (int): x location on the map image.
@@ -144,11 +186,12 @@ class MapHandler:
         Returns:
             province (EUProvince|None): The located province.
         """
-        for province in self.world_data.provinces.values():
-            if (image_x, image_y) in province.pixel_locations:
-                return province
+        province_id_map = self.world_data.province_id_map
+        height, width = province_id_map.shape
+        if not (0 <= image_x < width and 0 <= image_y < height):
+            return None
 
-        return None
+        return self.world_data.provinces.get(int(province_id_map[image_y, image_x]))
 
     def go_to_entity_location(self, destination: EUProvince|EUArea|EURegion|EUCountry):
         if not destination or not hasattr(destination, "bounding_box"):
@@ -157,6 +200,8 @@ class MapHandler:
         if self.pan_animation_id:
             self.tk_canvas.after_cancel(self.pan_animation_id)
 
+        self._finish_pending_zoom()
+
         displayer = self.displayer
         canvas_width, canvas_height = self.displayer.canvas_size
 
@@ -180,45 +225,86 @@ class MapHandler:
         target_offset_y = (canvas_height // 2) - (center_y * displayer.map_scale)
         target_offset_x, target_offset_y = self.clamp_offsets(target_offset_x, target_offset_y)
 
-        def animate_pan(step: int=0, pan_speed: int=10):
+        start_x, start_y = displayer.offset_x, displayer.offset_y
+        distance_x = target_offset_x - start_x
+        distance_y = target_offset_y - start_y
+        start_time = time.perf_counter()
+
+        def animate_pan(pan_speed: int=16):
             """Smoothly animates the camera to pan toward the target offset.
 
             Used to navigate towards the selected province, area, or region the user clicked on.
+            The position follows an ease-out curve over the elapsed time, so the pan always takes
+            `pan_duration` seconds, even if frames are late.
 
             Args:
-                step (int): The current animation step (unused but can be for progressive movement).
                 pan_speed (int): The delay in milliseconds between animation frames.
             """
-            dx = target_offset_x - displayer.offset_x
-            dy = target_offset_y - displayer.offset_y
+            progress = min(1.0, (time.perf_counter() - start_time) / self.pan_duration)
+            eased = 1 - (1 - progress) ** 3
+
+            displayer.offset_x = start_x + distance_x * eased
+            displayer.offset_y = start_y + distance_y * eased
+            # A zoom during the pan leaves a partial image that cannot be moved.
+            if displayer.viewport_map_size:
+                self._finish_pending_zoom()
+            self.tk_canvas.coords(displayer.image_id, displayer.offset_x, displayer.offset_y)
 
-            if abs(dx) < 1 and abs(dy) < 1:
-                displayer.offset_x = target_offset_x
-                displayer.offset_y = target_offset_y
-                self.clamp_offsets()
+            if progress >= 1.0:
+                self.pan_animation_id = None
+                return
 
-                return self.tk_canvas.coords(displayer.image_id, target_offset_x, target_offset_y)
+            self.pan_animation_id = self.tk_canvas.after(pan_speed, animate_pan)
 
-            displayer.offset_x += dx * 0.1
-            displayer.offset_y += dy * 0.1
+        animate_pan()
 
-            self.tk_canvas.coords(displayer.image_id, displayer.offset_x, displayer.offset_y)
+    def _on_configure(self, event: tk.Event):
+        """Keeps `displayer.canvas_size` in sync with the canvas when it is resized.
 
-            self.pan_animation_id = self.tk_canvas.after(pan_speed, animate_pan)
+        The event and callers read the cached size instead of querying Tk for the canvas
+        dimensions on every mouse event.
+        """
+        # The reported size includes the canvas border and highlight ring.
+        inset = 2 * (int(self.tk_canvas["borderwidth"]) + int(self.tk_canvas["highlightthickness"]))
+        canvas_size = (event.width - inset, event.height - inset)
 
-        animate_pan()
+        displayer = self.displayer
+        if canvas_size == displayer.canvas_size:
+            return
+
+        displayer.canvas_size = canvas_size
+        # The partial image of an unsettled zoom is pinned to the canvas origin and sized to the old canvas.
+        self._finish_pending_zoom()
+        self.clamp_offsets()
+        self.tk_canvas.coords(displayer.image_id, displayer.offset_x, displayer.offset_y)
 
     def _on_hover(self, event: tk.Event):
-        """Handles mouse hover events and updates the UI with province/area/region information."""
+        """Handles mouse hover events.
+
+        Only the latest cursor position is kept, and the hover information is updated from it
+        at most once every `hover_delay` milliseconds.
+        """
+        if self.disabled:
+            return
+
+        self._hover_cursor = (event.x, event.y)
+        if self._hover_flush_id is None:
+            self._hover_flush_id = self.tk_canvas.after(self.hover_delay, self._process_hover)
+
+    def _process_hover(self):
+        """Updates the UI with province/area/region information for the last hovered position."""
+        self._hover_flush_id = None
         if self.disabled:
             return
 
         displayer = self.displayer
-        canvas_x = event.x
-        canvas_y = event.y
+        canvas_x, canvas_y = self._hover_cursor
 
-        image_x, image_y = self.canvas_to_image_coords(canvas_x, canvas_y)
-        if not (0 <= image_x < displayer.original_map.width or
+        # Inlined `canvas_to_image_coords`, this runs for every processed motion event.
+        map_scale = displayer.map_scale
+        image_x = int((canvas_x - displayer.offset_x) / map_scale)
+        image_y = int((canvas_y - displayer.offset_y) / map_scale)
+        if not (0 <= image_x < displayer.original_map.width and
                 0 <= image_y < displayer.original_map.height):
             return
 
@@ -226,11 +312,37 @@ class MapHandler:
         if not province:
             return
 
-        area = displayer.world_data.province_to_area.get(province.province_id)
-        if not area:
+        map_mode = displayer.painter.map_mode
+        hover_key = (province.province_id, map_mode)
+        if hover_key == self._last_hover:
             return
 
-        map_mode = displayer.painter.map_mode
+        if hover_key in self._hover_text_cache:
+            info = self._hover_text_cache[hover_key]
+        else:
+            info = self._get_hover_text(province, map_mode)
+            self._hover_text_cache[hover_key] = info
+
+        if not info:
+            return
+
+        self._last_hover = hover_key
+        displayer.window["-MULTILINE-"].update(info)
+
+    def _get_hover_text(self, province: EUProvince, map_mode: MapMode):
+        """Builds the information shown when hovering over a province in the given map mode.
+
+        Args:
+            province (EUProvince): The hovered province.
+            map_mode (MapMode): The current map mode.
+
+        Returns:
+            info (str|None): The hover text, if any should be shown.
+        """
+        area = province.area
+        if not area:
+            return None
+
         if province.province_type == ProvinceType.WASTELAND:
             info = f"The wasteland of {province.name}"
         elif area.area_id == "lake_area":
@@ -254,9 +366,9 @@ class MapHandler:
                         info = f"The province of {province.name} ({area.name})"
 
                 case MapMode.REGION:
-                    region = displayer.world_data.province_to_region.get(province.province_id)
+                    region = province.region
                     if not region:
-                        return
+                        return None
 
                     if region.is_sea_region:
                         info = f"The waters of {region.name}"
@@ -273,9 +385,9 @@ class MapHandler:
                     if province.province_type == ProvinceType.SEA:
                         info = f"The waters of {province.name}"
                     else:
-                        trade_node = displayer.world_data.province_to_trade_node.get(province.province_id)
+                        trade_node = province.trade_node
                         if not trade_node:
-                            return
+                            return None
 
                         info = f"The province of {province.name} belogns to {trade_node.name}. It provides {province.trade_power} trade power to the node."
 
@@ -297,16 +409,15 @@ class MapHandler:
                             f"The province of {province.name} " 
                             f"(Religion: {MapUtils.format_name(province_religion) if province_religion else 'No Religion'})")
 
-        if not info:
-            return
-
-        displayer.window["-MULTILINE-"].update(info)
+        return info
 
     def _on_press(self, event: tk.Event):
         """Updates the handler attribtues and is triggered the left-mouse button is pressed."""
         if self.disabled:
             return
 
+        self._finish_pending_zoom()
+
         self.dragging = True
         self.prev_x = event.x
         self.prev_y = event.y
@@ -319,7 +430,8 @@ class MapHandler:
         
         Triggered whenever the cursor moves while the left mouse button is pressed.
         Continuously updates the canvas offsets to move the image accordingly, ensuring 
-        that panning remains within the allowed bounds.
+        that panning remains within the allowed bounds. The image itself is moved at most
+        once every `drag_delay` milliseconds.
         """
         if self.disabled:
             return
@@ -329,17 +441,32 @@ class MapHandler:
         if self.dragging:
             dx = event.x - self.prev_x
             dy = event.y - self.prev_y
-
             self.cursor_movement += (dx ** 2 + dy ** 2) ** 0.5
-            self.displayer.offset_x += dx
-            self.displayer.offset_y += dy
-            self.clamp_offsets()
 
-            self.tk_canvas.coords(displayer.image_id, displayer.offset_x, displayer.offset_y)
+            # Inlined `clamp_offsets`, this runs for every drag event.
+            map_width, map_height = displayer.map_size
+            canvas_width, canvas_height = displayer.canvas_size
+            offset_x = max(canvas_width - map_width, min(displayer.offset_x + dx, 0))
+            offset_y = max(canvas_height - map_height, min(displayer.offset_y + dy, 0))
+            displayer.offset_x = offset_x
+            displayer.offset_y = offset_y
+
+            if self._drag_flush_id is None:
+                self._drag_flush_id = self.tk_canvas.after(self.drag_delay, self._flush_drag)
 
             self.prev_x = event.x
             self.prev_y = event.y
 
+    def _flush_drag(self):
+        """Moves the map image to the latest offsets reached while dragging."""
+        self._drag_flush_id = None
+
+        displayer = self.displayer
+        # A zoom during the drag leaves a partial image that cannot be moved.
+        if displayer.viewport_map_size:
+            self._finish_pending_zoom()
+        self.tk_canvas.coords(displayer.image_id, displayer.offset_x, displayer.offset_y)
+
     def _on_release(self, event: tk.Event):
         """Handles mouse release events.
 
@@ -369,7 +496,7 @@ class MapHandler:
         canvas_y = event.y
 
         image_x, image_y = self.canvas_to_image_coords(canvas_x, canvas_y)
-        if not (0 <= image_x < displayer.original_map.width or
+        if not (0 <= image_x < displayer.original_map.width and
                 0 <= image_y < displayer.original_map.height):
             return
 
@@ -387,12 +514,12 @@ class MapHandler:
                 selected_item = province
 
             case MapMode.AREA:
-                selected_item = self.world_data.province_to_area.get(province.province_id)
+                selected_item = province.area
                 if not selected_item:
                     return
 
             case MapMode.REGION:
-                selected_item = self.world_data.province_to_region.get(province.province_id)
+                selected_item = province.region
                 if not selected_item:
                     return
 
@@ -400,7 +527,7 @@ class MapHandler:
                 selected_item = province
 
             case MapMode.TRADE:
-                selected_item = self.world_data.province_to_trade_node.get(province.province_id)
+                selected_item = province.trade_node
                 if not selected_item:
                     return
 
@@ -415,49 +542,59 @@ class MapHandler:
     def _on_zoom(self, event: tk.Event):
         """Handles zoom events triggered by the mouse scroll or trackpad gestures.
 
-        Determines the zoom direction based on the event data and calls `zoom_map` 
-        with the appropriate zoom direction.
+        Determines the zoom direction based on the event data and accumulates it. All events
+        already queued are collapsed into a single call to `_zoom_map` once Tk is idle.
         """
         if self.disabled:
             return
 
-        cursor_x, cursor_y = event.x, event.y
-
         if event.delta > 0 or event.num == 4:
-            self._zoom_map(cursor_x, cursor_y, zoom_in=True)
+            self._pending_zoom_steps += 1
         elif event.delta < 0 or event.num == 5:
-            self._zoom_map(cursor_x, cursor_y, zoom_in=False)
+            self._pending_zoom_steps -= 1
+        else:
+            return
+
+        self._zoom_cursor = (event.x, event.y)
+        if self._zoom_flush_id is None:
+            self._zoom_flush_id = self.tk_canvas.after_idle(self._flush_zoom)
+
+    def _flush_zoom(self):
+        """Applies all scroll steps accumulated since the last zoom with a single resize."""
+        self._zoom_flush_id = None
 
-    def _zoom_map(self, cursor_x: float, cursor_y: float, zoom_in: bool=True):
+        zoom_steps = self._pending_zoom_steps
+        self._pending_zoom_steps = 0
+        if zoom_steps:
+            cursor_x, cursor_y = self._zoom_cursor
+            self._zoom_map(cursor_x, cursor_y, zoom_steps)
+
+    def _zoom_map(self, cursor_x: float, cursor_y: float, zoom_steps: int=1):
         """Zooms in or out on the map while keeping the cursor position as the focal point.
 
         This function scales the map image based on the zoom factor, updates offsets 
         to maintain the cursor position in place, and ensures the new scale remains 
         within allowed limits.
 
+        While zooming only the visible part of the map is resampled, with a fast bilinear filter.
+        The full map is resampled with the slower Lanczos filter once the user stops zooming.
+
         Args:
             cursor_x (float): The x-coordinate of the cursor on the canvas.
             cursor_y (float): The y-coordinate of the cursor on the canvas.
-            zoom_in (bool, optional): Determines whether to zoom in (True) or out (False). 
-                Defaults to True.
+            zoom_steps (int, optional): The number of steps to zoom by, positive to zoom in and 
+                negative to zoom out. Defaults to 1.
         """
-        if self.zooming or self.disabled:
+        if self.disabled:
             return
 
         displayer = self.displayer
         canvas_width, canvas_height = displayer.canvas_size
 
-        if zoom_in and displayer.map_scale >= displayer.max_scale:
-            self.zooming = False
-            return
-
-        if not zoom_in and displayer.map_scale <= displayer.min_scale:
-            self.zooming = False
-            return
-
-        self.zooming = True
-        new_scale = displayer.map_scale * self.scale_factor if zoom_in else displayer.map_scale / self.scale_factor
+        new_scale = displayer.map_scale * self.scale_factor ** zoom_steps
         new_scale = min(displayer.max_scale, max(displayer.min_scale, new_scale))
+        if new_scale == displayer.map_scale:
+            return
 
         scaled_width = int(displayer.original_map.width * new_scale)
         scaled_height = int(displayer.original_map.height * new_scale)
@@ -474,10 +611,38 @@ class MapHandler:
         displayer.offset_x = new_offset_x
         displayer.offset_y = new_offset_y
         displayer.map_scale = new_scale
-        self.clamp_offsets()
 
-        self.displayer.map_image = self.displayer.original_map.resize(
-            (scaled_width, scaled_height), Image.Resampling.LANCZOS)
-        self.displayer.update_canvas()
+        self.cancel_zoom_settle()
+        scaled_size = (scaled_width, scaled_height)
+        if scaled_size in displayer.scaled_map_cache:
+            displayer.show_scaled_map(scaled_size)
+            return
 
-        self.tk_canvas.after(50, lambda: setattr(self, 'zooming', False))
+        displayer.show_map_viewport(scaled_size, Image.Resampling.BILINEAR)
+        self._zoom_settle_id = self.tk_canvas.after(self.zoom_settle_delay, self._finalize_zoom)
+
+    def cancel_zoom_settle(self):
+        """Cancels the scheduled full quality pass, if any.
+
+        Also needed whenever the displayed map is replaced, so that the pass does not resample
+        a stale size or draw the old map over the new one.
+        """
+        if self._zoom_settle_id is not None:
+            self.tk_canvas.after_cancel(self._zoom_settle_id)
+            self._zoom_settle_id = None
+
+    def _finalize_zoom(self):
+        """Resamples the zoomed map at full quality once zooming has settled."""
+        self._zoom_settle_id = None
+
+        displayer = self.displayer
+        displayer.show_scaled_map(displayer.map_size, Image.Resampling.LANCZOS, cache=True)
+
+    def _finish_pending_zoom(self):
+        """Displays the full scaled map right away if only the visible part of a zoom is shown.
+
+        Needed before the map is panned, as the partial image is pinned to the canvas origin.
+        """
+        self.cancel_zoom_settle()
+        if self.displayer.viewport_map_size:
+            self._finalize_zoom()
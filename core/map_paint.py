@@ -19,11 +19,16 @@ Map Modes:
 
 import math
 import numpy as np
+import os
+import threading
 
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from PIL import Image
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 from .colors import EUColors
-from .models import MapMode, ProvinceType, ProvinceTypeColor
+from .models import EUProvince, MapMode, ProvinceType, ProvinceTypeColor
 from .utils import MapUtils
 from .world import EUWorldData
 
@@ -42,31 +47,74 @@ class MapPainter:
             provinces, areas, regions, and countries.
         
         _world_image (Image): The base world map image, loaded from `EUWorldData`.
-        _world_image_borderless (Image): A reference to `_world_image`, used for drawing maps 
-            without borders.
+        _base_pixels (np.ndarray|None): A read-only array of `_world_image`, converted once and
+            shared by every redraw.
         
-        _image_cache (dict[MapMode, dict]): A cache storing previously rendered map images 
-            for each map mode. Each mode stores a bordered and borderless version.
+        _default_palette (np.ndarray|None): The default world image color of each province, indexed by
+            province ID. Built on first use.
+        _unmapped_pixels (tuple[np.ndarray, np.ndarray]|None): The flat indices of pixels not
+            belonging to any province, and their packed world image colors. Built on first use.
+        _province_labels (dict[str, np.ndarray]): The group label of each province for each 
+            grouping (province, area, region, trade node), indexed by province ID.
+        _border_pixels (dict[str, tuple[np.ndarray, np.ndarray]]): The border pixels of each
+            grouping, shared by every map mode drawing those borders.
+
+        _image_cache (OrderedDict[MapMode, dict]): A cache storing recently rendered map images 
+            for each map mode, least recently used first. Each mode stores a bordered and borderless
+            version, kept as the drawn pixel array until the image is first requested.
             
             ex: {
                 MapMode.POLITICAL: {
                     "border": Image (with borders),
-                    "no_border": Image (without borders)
+                    "no_border": NDArray (without borders, not requested yet)
                 }
             }
         
+        image_cache_size (int): The maximum number of map modes kept in `_image_cache`. Every mode 
+            holds two full size maps, about 100 MB for the default world.
+        _image_cache_lock (threading.Lock): Guards `_image_cache` and `_pending_draws`, as background 
+            draws and their completion callbacks change them too. Never held while waiting on a draw.
+        _pending_draws (dict[MapMode, Future]): Map modes being drawn in the background by
+            `precompute_map_modes()`.
+        paint_workers (int): The number of threads that paint a map from its palette. 
+            Defaults to the CPU count.
+        
         map_mode (MapMode): The currently active map mode (e.g., Political, Area). Set to `MapMode.POLITICAL` by default.
         map_modes (dict[MapMode, Callable]): Mapping `MapMode` values to their respective 
             drawing methods for rendering different map visualizations.
     """
+    # Default colors for unowned province types.
+    _TYPE_COLORS_ALL = {
+        ProvinceType.NATIVE: ProvinceTypeColor.NATIVE.value,
+        ProvinceType.SEA: ProvinceTypeColor.SEA.value,
+        ProvinceType.WASTELAND: ProvinceTypeColor.WASTELAND.value,
+    }
+
+    # Default colors for uninhabited province types, which have no development, culture, or religion.
+    _TYPE_COLORS_UNINHABITED = {
+        ProvinceType.SEA: ProvinceTypeColor.SEA.value,
+        ProvinceType.WASTELAND: ProvinceTypeColor.WASTELAND.value,
+    }
+
     def __init__(self, colors: EUColors=None, world_data: EUWorldData=None):
         self.colors = colors
         self.world_data = world_data
 
-        self._world_image = self.world_data.world_image if world_data else None
-        self._world_image_borderless = self._world_image if world_data else None
+        self._world_image: Optional[Image.Image] = None
+        self._base_pixels: Optional[np.ndarray] = None
+        if world_data:
+            self.set_base_world_image(world_data.world_image)
+
+        self._default_palette: Optional[np.ndarray] = None
+        self._unmapped_pixels: Optional[tuple[np.ndarray, np.ndarray]] = None
+        self._province_labels: dict[str, np.ndarray] = {}
+        self._border_pixels: dict[str, tuple[np.ndarray, np.ndarray]] = {}
 
-        self._image_cache: dict[MapMode, dict] = {}
+        self._image_cache: OrderedDict[MapMode, dict] = OrderedDict()
+        self.image_cache_size = 4
+        self._image_cache_lock = threading.Lock()
+        self._pending_draws: dict[MapMode, Future] = {}
+        self.paint_workers = os.cpu_count() or 1
 
         self.map_mode = MapMode.POLITICAL
         self.map_modes = {
@@ -82,52 +130,335 @@ class MapPainter:
         self.update_status_callback: Optional[Callable[[str], None]] = None
 
     def set_base_world_image(self, image: Image.Image):
+        """Sets the base world map image that every map mode is drawn over.
+
+        Images with another mode (such as RGBA) are converted to RGB, as only the color 
+        channels are painted.
+
+        Args:
+            image (Image): The base world map image.
+        """
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
         self._world_image = image
+        self._base_pixels = np.asarray(image)
+        self._base_pixels.flags.writeable = False
 
     def get_cached_map_image(self, borders: bool=True) -> Image.Image:
         """Retrieves the cached map image for the current map mode.
         
         If the requested map image is not in the cache, draws it and then adds it to the cache for future use.
+        The map mode becomes the most recently used one, so it is evicted last.
+        The drawn pixels are only wrapped in an image the first time they are requested, as
+        usually only one of the bordered and borderless versions is shown. The pixels are RGBX,
+        the layout Pillow stores RGB images in, so the image shares their memory without a copy.
 
         Args:
             borders (bool, optional): Whether to retrieve the bordered version of the map.
                 Defaults to True.
 
         Returns:
-            Image: The cached map image.
+            Image: The cached map image, in RGBX mode. It is read-only.
         """
         cache_border_key = "border" if borders else "no_border"
 
-        if self.map_mode not in self._image_cache:
-            self.draw_map()
+        mode_cache = None
+        while mode_cache is None:
+            with self._image_cache_lock:
+                mode_cache = self._image_cache.get(self.map_mode)
+                if mode_cache is not None:
+                    self._image_cache.move_to_end(self.map_mode)
+                else:
+                    pending_draw = self._pending_draws.pop(self.map_mode, None)
+
+            # Background draws can evict the mode again before it is read, so check once more.
+            if mode_cache is None:
+                if pending_draw and not pending_draw.cancel():
+                    pending_draw.result()
+                else:
+                    self.draw_map()
+
+        map_image = mode_cache.get(cache_border_key)
+        if isinstance(map_image, np.ndarray):
+            height, width = map_image.shape[:2]
+            map_image = Image.frombuffer("RGBX", (width, height), map_image, "raw", "RGBX", 0, 1)
+            mode_cache[cache_border_key] = map_image
 
-        return self._image_cache[self.map_mode].get(cache_border_key)
+        return map_image
 
     def clear_cache(self, mode: MapMode=None):
-        """Clears the cache for the image of a specific map mode or all modes."""
+        """Clears the cache for the image of a specific map mode or all modes.
+        
+        Clearing all modes also clears the cached province groupings and borders, as a new
+        save can change them.
+        """
         if mode:
-            self._image_cache.pop(mode, None)
+            with self._image_cache_lock:
+                pending_draw = self._pending_draws.pop(mode, None)
+
+            if pending_draw and not pending_draw.cancel():
+                pending_draw.exception()
+
+            with self._image_cache_lock:
+                self._image_cache.pop(mode, None)
         else:
-            self._image_cache.clear()
+            self.cancel_precompute()
+            with self._image_cache_lock:
+                self._image_cache.clear()
+            self._province_labels.clear()
+            self._border_pixels.clear()
+
+    def precompute_map_modes(self, max_workers: int=2):
+        """Draws the map modes that are not cached yet in background threads.
+
+        The draw methods spend most of their time in NumPy, which releases the GIL, so the 
+        modes are drawn while the UI stays responsive. Switching to a mode later only
+        waits for its draw to finish if it has not already. Only as many modes are drawn as
+        fit in the free slots of the cache, so that no drawn mode is evicted right away.
 
-    def draw_map(self):
-        """Driver that calls the draw method for the current map mode and updates the **map image**.
+        Args:
+            max_workers (int, optional): The number of modes drawn at the same time.
+        """
+        with self._image_cache_lock:
+            modes = [
+                mode for mode in self.map_modes
+                if mode not in self._image_cache and mode not in self._pending_draws]
+            free_slots = self.image_cache_size - len(self._image_cache) - len(self._pending_draws)
+            modes = modes[:max(free_slots, 0)]
+            if not modes:
+                return
+
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            pending_draws = {mode: executor.submit(self.draw_map, mode) for mode in modes}
+            self._pending_draws.update(pending_draws)
+
+        # Outside of the lock, as callbacks of draws that already finished run right away.
+        for mode, pending_draw in pending_draws.items():
+            pending_draw.add_done_callback(partial(self._forget_pending_draw, mode))
+
+        executor.shutdown(wait=False)
+
+    def _forget_pending_draw(self, mode: MapMode, pending_draw: Future):
+        """Removes a finished background draw, so that a mode evicted from the cache later is drawn again.
+
+        Args:
+            mode (MapMode): The map mode that was drawn.
+            pending_draw (Future): The finished draw.
+        """
+        with self._image_cache_lock:
+            if self._pending_draws.get(mode) is pending_draw:
+                self._pending_draws.pop(mode, None)
+
+    def cancel_precompute(self):
+        """Cancels the background draws that have not started and waits for the running ones.
+
+        Must be called before the world data changes, so that no draw reads a half built world
+        or caches a stale map.
+        """
+        with self._image_cache_lock:
+            pending_draws = list(self._pending_draws.values())
+
+        # Cancelling runs the draws' callbacks, which take the lock.
+        for pending_draw in pending_draws:
+            if not pending_draw.cancel():
+                pending_draw.exception()
+
+        with self._image_cache_lock:
+            self._pending_draws.clear()
+
+    def draw_map(self, map_mode: MapMode=None):
+        """Driver that calls the draw method for a map mode and caches the **map images**.
         
+        The base world image is left untouched, so every mode is drawn over the same base.
+        If the cache holds more than `image_cache_size` modes, the least recently used 
+        ones are evicted.
+
+        Args:
+            map_mode (MapMode, optional): The map mode to draw. Defaults to the current map mode.
+
         Returns:
-            PIL.Image: The current map image.
+            NDArray: The current `(height, width, 4)` RGBX map pixels, with borders. Use 
+                `get_cached_map_image()` for an image.
         """
-        draw_method = self.map_modes.get(self.map_mode, self._draw_map_political)
+        map_mode = map_mode or self.map_mode
+        draw_method = self.map_modes.get(map_mode, self._draw_map_political)
         map_pixels, map_pixels_borderless = draw_method()
 
-        self._world_image = Image.fromarray(map_pixels)
-        self._world_image_borderless = Image.fromarray(map_pixels_borderless)
+        with self._image_cache_lock:
+            self._image_cache[map_mode] = {
+                "border": map_pixels,
+                "no_border": map_pixels_borderless
+            }
+            self._image_cache.move_to_end(map_mode)
+            while len(self._image_cache) > self.image_cache_size:
+                self._image_cache.popitem(last=False)
 
-        self._image_cache[self.map_mode] = {
-            "border": Image.fromarray(map_pixels),
-            "no_border": Image.fromarray(map_pixels_borderless)
-        }
+        return map_pixels
+
+    def _get_default_palette(self):
+        """Gets a palette of the default world image color of each province.
+
+        Returns:
+            palette (NDArray): A `(max_province_id + 1, 3)` uint8 array indexed by province ID.
+        """
+        if self._default_palette is None:
+            province_colors = self.colors.default_province_colors
+            palette = np.zeros((max(province_colors.values()) + 1, 3), dtype=np.uint8)
+            for color, province_id in province_colors.items():
+                palette[province_id] = color
+
+            self._default_palette = palette
+
+        return self._default_palette.copy()
+
+    def _paint_from_palette(self, palette: np.ndarray):
+        """Colors every pixel of the world by the palette color of the province occupying it.
+
+        This is a single gather over `province_id_map`, instead of writing each province's pixels.
+        Colors are packed into 32 bit values first, so the gather moves one element per pixel.
+        The gather releases the GIL, so it is split into horizontal bands run on `paint_workers` 
+        threads. Pixels not belonging to any province keep their world image color.
+
+        Args:
+            palette (NDArray): A `(max_province_id + 1, 3)` uint8 array indexed by province ID.
+
+        Returns:
+            map_pixels (NDArray): The `(height, width, 4)` painted RGBX map.
+        """
+        packed_palette = MapUtils.pack_palette(palette)
+        province_id_map = self.world_data.province_id_map
+        packed_pixels = np.empty(province_id_map.shape, dtype=np.uint32)
+
+        height = province_id_map.shape[0]
+        band_height = -(-height // self.paint_workers)
+        bands = [slice(start, start + band_height) for start in range(0, height, band_height)]
+        if len(bands) > 1:
+            with ThreadPoolExecutor(max_workers=len(bands)) as executor:
+                # Consumed so that errors in a band are raised here.
+                list(executor.map(
+                    lambda band: np.take(packed_palette, province_id_map[band], out=packed_pixels[band]), bands))
+        else:
+            np.take(packed_palette, province_id_map, out=packed_pixels)
+
+        if self._unmapped_pixels is None:
+            unmapped_indices = np.flatnonzero(province_id_map == 0)
+            base_colors = self._base_pixels.reshape(-1, 3)[unmapped_indices]
+            self._unmapped_pixels = unmapped_indices, MapUtils.pack_palette(base_colors)
+
+        unmapped_indices, unmapped_colors = self._unmapped_pixels
+        if unmapped_indices.size:
+            packed_pixels.reshape(-1)[unmapped_indices] = unmapped_colors
+
+        return packed_pixels.view(np.uint8).reshape(province_id_map.shape + (4,))
+
+    def _get_province_labels(self, key: str, groups: Iterable[Iterable[EUProvince]]):
+        """Gets the label of the group that each province belongs to, such as its area or region.
+
+        Labels are cached under `key` until `clear_cache()` clears all modes.
+
+        Args:
+            key (str): The name of the grouping, used as the cache key.
+            groups (Iterable[Iterable[EUProvince]]): The provinces of each group. Only read 
+                if the labels are not cached yet.
+
+        Returns:
+            labels (NDArray): A uint16 array indexed by province ID, holding the 1-based index of
+                the group containing the province, or 0 if it is not in any group.
+        """
+        if key not in self._province_labels:
+            labels = np.zeros(len(self._get_default_palette()), dtype=np.uint16)
+            for label, provinces in enumerate(groups, start=1):
+                for province in provinces:
+                    labels[province.province_id] = label
+
+            self._province_labels[key] = labels
+
+        return self._province_labels[key]
+
+    def _get_area_groups(self):
+        """Gets the provinces of each area, for grouping labels and borders.
+
+        A province that is listed in two areas is only kept in `province.area`, so that the
+        map agrees with the area shown when clicking or hovering on it.
+
+        Returns:
+            Iterator[list[EUProvince]]: The provinces of each area.
+        """
+        return (
+            [province for province in area if province.area is area]
+            for area in self.world_data.areas.values())
 
-        return self._world_image
+    def _get_region_groups(self):
+        """Gets the provinces of each region, for grouping labels and borders.
+
+        A province in areas of two regions is only kept in `province.region`.
+
+        Returns:
+            Iterator[list[EUProvince]]: The provinces of each region.
+        """
+        return (
+            [province for province in region.provinces if province.region is region]
+            for region in self.world_data.regions.values())
+
+    def _get_border_pixels(self, key: str, groups: Iterable[Iterable[EUProvince]]):
+        """Gets the border pixels of groups of provinces, such as areas or regions.
+
+        A pixel is on a border if it belongs to a group and any of its eight neighbors do not 
+        belong to the same group. Borders only depend on the world geography, so they are found
+        once for the whole map with a few shifted comparisons, instead of per entity, and cached
+        under `key` until `clear_cache()` clears all modes.
+
+        Args:
+            key (str): The name of the grouping, used as the cache key.
+            groups (Iterable[Iterable[EUProvince]]): The provinces of each group. Only read 
+                if the borders are not cached yet.
+
+        Returns:
+            border_pixels (tuple[NDArray, NDArray]): The flat indices of the border pixels, and 
+                the province ID at each of them.
+        """
+        if key not in self._border_pixels:
+            province_id_map = self.world_data.province_id_map
+            label_map = self._get_province_labels(key, groups)[province_id_map]
+
+            # Pad with 0 so that pixels on the edge of the map are borders too.
+            height, width = label_map.shape
+            padded = np.pad(label_map, 1)
+            is_border = np.zeros((height, width), dtype=bool)
+            for dy in (0, 1, 2):
+                for dx in (0, 1, 2):
+                    if dy != 1 or dx != 1:
+                        is_border |= padded[dy:dy + height, dx:dx + width] != label_map
+
+            is_border &= label_map > 0
+            border_indices = np.flatnonzero(is_border)
+            self._border_pixels[key] = (border_indices, province_id_map.ravel()[border_indices])
+
+        return self._border_pixels[key]
+
+    def _paint_borders(
+        self,
+        map_pixels: np.ndarray,
+        border_pixels: tuple[np.ndarray, np.ndarray],
+        border_palette: np.ndarray,
+        province_mask: Optional[np.ndarray]=None):
+        """Colors border pixels with the border palette color of the province at each of them.
+
+        Args:
+            map_pixels (NDArray): The `(height, width, 4)` RGBX map to paint.
+            border_pixels (tuple[NDArray, NDArray]): The border pixels from `_get_border_pixels()`.
+            border_palette (NDArray): A `(max_province_id + 1, 3)` uint8 array indexed by province ID.
+            province_mask (NDArray, optional): A boolean array indexed by province ID. If given, 
+                only the borders of the provinces set in it are painted.
+        """
+        border_indices, border_province_ids = border_pixels
+        if province_mask is not None:
+            keep = province_mask[border_province_ids]
+            border_indices, border_province_ids = border_indices[keep], border_province_ids[keep]
+
+        packed_border_palette = MapUtils.pack_palette(border_palette)
+        map_pixels.view(np.uint32).reshape(-1)[border_indices] = packed_border_palette[border_province_ids]
 
     def _draw_map_political(self):
         """Draws the map in the **Political** map mode.
@@ -143,47 +474,22 @@ class MapPainter:
         """
         world_provinces = self.world_data.provinces
 
-        map_pixels_bordered = np.array(self._world_image)
-        map_pixels_borderless = map_pixels_bordered.copy()
-
-        # Default colors for unowned province types.
-        province_type_colors = {
-            ProvinceType.NATIVE: ProvinceTypeColor.NATIVE.value,
-            ProvinceType.SEA: ProvinceTypeColor.SEA.value,
-            ProvinceType.WASTELAND: ProvinceTypeColor.WASTELAND.value,
-        }
-
-        # Precompute pixel locations.
-        all_province_pixels = {
-            province.province_id: np.array(list(province.pixel_locations))
-            for province in world_provinces.values()}
-
-        all_province_border_pixels = {
-            province.province_id: np.array(list(province.border_pixels))
-            for province in world_provinces.values()}
-
+        palette = self._get_default_palette()
         for province in world_provinces.values():
-            province_pixels = all_province_pixels.get(province.province_id)
-            if province_pixels.size == 0:
-                continue
-
             province_type = province.province_type
             if province_type == ProvinceType.OWNED:
                 owner_country = province.owner
                 province_color = owner_country.map_color
             else:
-                province_color = province_type_colors.get(province_type, None)
+                province_color = self._TYPE_COLORS_ALL.get(province_type, None)
 
-            # Transpose (N, 2) array into `x` and `y` arrays for vectorized indexing.
-            x_coords, y_coords = province_pixels.T
+            palette[province.province_id] = province_color
 
-            map_pixels_bordered[y_coords, x_coords] = province_color
-            map_pixels_borderless[y_coords, x_coords] = province_color
+        map_pixels_borderless = self._paint_from_palette(palette)
+        map_pixels_bordered = map_pixels_borderless.copy()
 
-            border_pixels = all_province_border_pixels.get(province.province_id)
-            if border_pixels.size > 0:
-                x_border_coords, y_border_coords = border_pixels.T
-                map_pixels_bordered[y_border_coords, x_border_coords] = MapUtils.get_border_color(province_color, darken_by=10)
+        province_borders = self._get_border_pixels("province", ([province] for province in world_provinces.values()))
+        self._paint_borders(map_pixels_bordered, province_borders, MapUtils.get_border_palette(palette, darken_by=10))
 
         return map_pixels_bordered, map_pixels_borderless
 
@@ -202,46 +508,36 @@ class MapPainter:
         """
         world_areas = self.world_data.areas
 
-        map_pixels_bordered = np.array(self._world_image)
-        map_pixels_borderless = map_pixels_bordered.copy()
-
-        # Precompute pixel locations.
-        all_area_pixels = {
-            area.area_id: np.array(list(area.pixel_locations))
-            for area in world_areas.values()}
-
-        all_area_border_pixels = {
-            area.area_id: np.array(list(area.border_pixels))
-            for area in world_areas.values()}
-
-        for area_id, area_pixels in all_area_pixels.items():
-            area = world_areas[area_id]
-            if area_pixels.size == 0:
+        area_colors = {}
+        for area_id, area in world_areas.items():
+            if area.pixel_xs.size == 0:
                 continue
 
             if area.is_land_area:
-                area_color = MapUtils.seed_color(area_id)
+                area_colors[area_id] = MapUtils.seed_color(area_id)
             elif area.is_sea_area:
-                area_color = ProvinceTypeColor.SEA.value
+                area_colors[area_id] = ProvinceTypeColor.SEA.value
             elif area.is_wasteland_area:
-                area_color = ProvinceTypeColor.WASTELAND.value
+                area_colors[area_id] = ProvinceTypeColor.WASTELAND.value
 
-            # Transpose (N, 2) array into `x` and `y` arrays for vectorized indexing.
-            x_coords, y_coords = area_pixels.T
+        # Provinces listed in two areas take the color of `province.area`, which clicking and hovering show.
+        palette = self._get_default_palette()
+        for province in self.world_data.provinces.values():
+            area = province.area
+            if area is not None and area.area_id in area_colors:
+                palette[province.province_id] = area_colors[area.area_id]
 
-            map_pixels_bordered[y_coords, x_coords] = area_color
-            map_pixels_borderless[y_coords, x_coords] = area_color
+        map_pixels_borderless = self._paint_from_palette(palette)
+        map_pixels_bordered = map_pixels_borderless.copy()
 
-            # Color provincee borders within the area first
-            province_border_pixels = np.array(list(border_pixel for province in area for border_pixel in province.border_pixels))
-            if province_border_pixels.size > 0:
-                x_province_border_coords, y_province_border_coords = province_border_pixels.T
-                map_pixels_bordered[y_province_border_coords, x_province_border_coords] = MapUtils.get_border_color(area_color)
+        # Color province borders within the areas first
+        world_provinces = self.world_data.provinces
+        province_borders = self._get_border_pixels("province", ([province] for province in world_provinces.values()))
+        area_borders = self._get_border_pixels("area", self._get_area_groups())
+        in_area = self._get_province_labels("area", self._get_area_groups()) > 0
 
-            area_border_pixels = all_area_border_pixels.get(area_id)
-            if area_border_pixels.size > 0:
-                x_border_coords, y_border_coords = area_border_pixels.T
-                map_pixels_bordered[y_border_coords, x_border_coords] = MapUtils.get_border_color(area_color, darken_by=25)
+        self._paint_borders(map_pixels_bordered, province_borders, MapUtils.get_border_palette(palette), in_area)
+        self._paint_borders(map_pixels_bordered, area_borders, MapUtils.get_border_palette(palette, darken_by=25))
 
         return map_pixels_bordered, map_pixels_borderless
 
@@ -260,80 +556,72 @@ class MapPainter:
         """
         world_regions = self.world_data.regions
 
-        map_pixels_bordered = np.array(self._world_image)
-        map_pixels_borderless = map_pixels_bordered.copy()
-
-        # Precompute pixel locations.
-        all_region_pixels = {
-            region.region_id: np.array(list(region.pixel_locations)) 
-            for region in world_regions.values()}
-
-        all_region_border_pixels = {
-            region.region_id: np.array(list(region.border_pixels)) 
-            for region in world_regions.values()}
-
-        for region_id, region_pixels in all_region_pixels.items():
-            region = world_regions[region_id]
-            if region_pixels.size == 0:
+        region_colors = {}
+        for region_id, region in world_regions.items():
+            if region.pixel_xs.size == 0:
                 continue
 
             if region.is_land_region:
-                region_color = MapUtils.seed_color(region_id)
+                region_colors[region_id] = MapUtils.seed_color(region_id)
             elif region.is_sea_region:
-                region_color = ProvinceTypeColor.SEA.value
-
-            # Transpose (N, 2) array into `x` and `y` arrays for vectorized indexing.
-            x_coords, y_coords = region_pixels.T
-
-            map_pixels_bordered[y_coords, x_coords] = region_color
-            map_pixels_borderless[y_coords, x_coords] = region_color
+                region_colors[region_id] = ProvinceTypeColor.SEA.value
 
-            # Color area borders within the region first
-            area_border_pixels = np.array(list(border_pixel for area in region for border_pixel in area.border_pixels))
-            if area_border_pixels.size > 0:
-                x_province_border_coords, y_province_border_coords = area_border_pixels.T
-                map_pixels_bordered[y_province_border_coords, x_province_border_coords] = MapUtils.get_border_color(region_color, 25)
+        # Provinces in areas of two regions take the color of `province.region`, which clicking and hovering show.
+        palette = self._get_default_palette()
+        for province in self.world_data.provinces.values():
+            region = province.region
+            if region is not None and region.region_id in region_colors:
+                palette[province.province_id] = region_colors[region.region_id]
 
-            border_pixels = all_region_border_pixels.get(region_id)
-            if border_pixels.size > 0:
-                x_border_coords, y_border_coords = border_pixels.T
-                map_pixels_bordered[y_border_coords, x_border_coords] = MapUtils.get_border_color(region_color, darken_by=35)
+        map_pixels_borderless = self._paint_from_palette(palette)
+        map_pixels_bordered = map_pixels_borderless.copy()
 
-        wasteland_pixels = set()
-        for province in self.world_data.areas.get("wasteland_area"):
-            if province.pixel_locations:
-                wasteland_pixels.update(province.pixel_locations)
+        # Color area borders within the regions first
+        area_borders = self._get_border_pixels("area", self._get_area_groups())
+        region_borders = self._get_border_pixels("region", self._get_region_groups())
+        in_region = self._get_province_labels("region", self._get_region_groups()) > 0
 
-        x_wasteland_coords, y_wasteland_coords = zip(*wasteland_pixels)
+        self._paint_borders(map_pixels_bordered, area_borders, MapUtils.get_border_palette(palette, darken_by=25), in_region)
+        self._paint_borders(map_pixels_bordered, region_borders, MapUtils.get_border_palette(palette, darken_by=35))
 
-        map_pixels_bordered[y_wasteland_coords, x_wasteland_coords] = ProvinceTypeColor.WASTELAND.value
-        map_pixels_borderless[y_wasteland_coords, x_wasteland_coords] = ProvinceTypeColor.WASTELAND.value
+        self._paint_wasteland_and_lakes(map_pixels_bordered, map_pixels_borderless)
 
-        lake_pixels = set()
-        for province in self.world_data.areas.get("lake_area"):
-            if province.pixel_locations:
-                lake_pixels.update(province.pixel_locations)
-
-        x_lake_coords, y_lake_coords = zip(*lake_pixels)
+        return map_pixels_bordered, map_pixels_borderless
 
-        map_pixels_bordered[y_lake_coords, x_lake_coords] = ProvinceTypeColor.SEA.value
-        map_pixels_borderless[y_lake_coords, x_lake_coords] = ProvinceTypeColor.SEA.value
+    def _paint_wasteland_and_lakes(self, *maps_pixels: np.ndarray):
+        """Paints the wasteland and lake areas over maps that do not group them otherwise.
 
-        return map_pixels_bordered, map_pixels_borderless
+        Each area is written with one assignment through its cached flat pixel indices.
 
-    def _development_to_color(self, development: int, max_development: float=150):
-        """Gets the green color for province given its development.
+        Args:
+            *maps_pixels (NDArray): The `(height, width, 4)` RGBX maps to paint.
+        """
+        areas = self.world_data.areas
+        for area_id, area_color in (
+            ("wasteland_area", ProvinceTypeColor.WASTELAND.value),
+            ("lake_area", ProvinceTypeColor.SEA.value)):
+            area = areas.get(area_id)
+            packed_color = MapUtils.pack_palette(np.array([area_color], dtype=np.uint8))[0]
+            for map_pixels in maps_pixels:
+                pixel_indices = area.get_pixel_indices(map_pixels.shape[1])
+                map_pixels.view(np.uint32).reshape(-1)[pixel_indices] = packed_color
+
+    def _development_to_color(self, developments: np.ndarray, max_development: float=150):
+        """Gets the green colors for provinces given their development.
         
         Args:
-            development (int): The development of the province.
+            developments (np.ndarray): The development of each province.
             max_development (int): The max development in the world or a default value for comparisons.
         
         Returns:
-            tuple[int]: The computed province color.
+            np.ndarray: An `(N, 3)` uint8 array of the computed province colors.
         """
-        normalized = math.log(max(1, development)) / math.log(max(1, max_development))
-        intensity = int(255 * normalized)
-        return (0, intensity, 0)
+        normalized = np.log(np.maximum(1, developments)) / math.log(max(1, max_development))
+
+        # Clip before narrowing, developments above `max_development` would otherwise wrap around.
+        colors = np.zeros((len(developments), 3), dtype=np.uint8)
+        colors[:, 1] = np.clip(255 * normalized, 0, 255).astype(np.uint8)
+        return colors
 
     def _draw_map_development(self):
         """Draws the map in the **Development** map mode.
@@ -350,43 +638,26 @@ class MapPainter:
         """
         world_provinces = self.world_data.provinces
 
-        map_pixels_bordered = np.array(self._world_image)
-        map_pixels_borderless = map_pixels_bordered.copy()        
-
-        province_type_colors = {
-            ProvinceType.SEA: ProvinceTypeColor.SEA.value,
-            ProvinceType.WASTELAND: ProvinceTypeColor.WASTELAND.value,
-        }
-
+        palette = self._get_default_palette()
+        land_province_ids = []
+        land_developments = []
         max_development = max(province.development for province in world_provinces.values())
-        # Precompute pixel locations.
-        all_province_pixels = {
-            province.province_id: np.array(list(province.pixel_locations))
-            for province in world_provinces.values()}
-
-        all_province_border_pixels = {
-            province.province_id: np.array(list(province.border_pixels))
-            for province in world_provinces.values()}
-
         for province in world_provinces.values():
-            province_pixels = all_province_pixels.get(province.province_id)
-            if province_pixels.size == 0:
-                continue
-
-            province_color = province_type_colors.get(province.province_type)
+            province_color = self._TYPE_COLORS_UNINHABITED.get(province.province_type)
             if province_color is None:
-                province_color = self._development_to_color(province.development, max_development)
+                land_province_ids.append(province.province_id)
+                land_developments.append(province.development)
+            else:
+                palette[province.province_id] = province_color
 
-            # Transpose (N, 2) array into `x` and `y` arrays for vectorized indexing.
-            x_coords, y_coords = province_pixels.T
+        palette[land_province_ids] = self._development_to_color(
+            np.array(land_developments, dtype=np.float64), max_development)
 
-            map_pixels_bordered[y_coords, x_coords] = province_color
-            map_pixels_borderless[y_coords, x_coords] = province_color
+        map_pixels_borderless = self._paint_from_palette(palette)
+        map_pixels_bordered = map_pixels_borderless.copy()
 
-            border_pixels = all_province_border_pixels.get(province.province_id)
-            if border_pixels.size > 0:
-                x_border_coords, y_border_coords = border_pixels.T
-                map_pixels_bordered[y_border_coords, x_border_coords] = MapUtils.get_border_color(province_color)
+        province_borders = self._get_border_pixels("province", ([province] for province in world_provinces.values()))
+        self._paint_borders(map_pixels_bordered, province_borders, MapUtils.get_border_palette(palette, darken_by=10))
 
         return map_pixels_bordered, map_pixels_borderless
 
@@ -404,57 +675,25 @@ class MapPainter:
                 - map_pixels_borderless: A NumPy array of the same map without borders.
         """
         world_nodes = self.world_data.trade_nodes
-        
-        map_pixels_bordered = np.array(self._world_image)
-        map_pixels_borderless = map_pixels_bordered.copy()
-
-        all_node_pixels = {
-            node.trade_node_id: np.array(list(node.pixel_locations))
-            for node in world_nodes.values()
-        }
-
-        all_node_border_pixels = {
-            node.trade_node_id: np.array(list(node.border_pixels))
-            for node in world_nodes.values()
-        }
 
+        palette = self._get_default_palette()
         for trade_node in world_nodes.values():
-            node_pixels = all_node_pixels.get(trade_node.trade_node_id)
-            if node_pixels.size == 0:
+            if trade_node.pixel_xs.size == 0:
                 continue
 
             node_color = MapUtils.seed_color(name=trade_node.trade_node_id)
 
-            # Transpose (N, 2) array into `x` and `y` arrays for vectorized indexing.
-            x_coords, y_coords = node_pixels.T
-
-            map_pixels_bordered[y_coords, x_coords] = node_color
-            map_pixels_borderless[y_coords, x_coords] = node_color
-
-            border_pixels = all_node_border_pixels.get(trade_node.trade_node_id)
-            if border_pixels.size > 0:
-                x_border_coords, y_border_coords = border_pixels.T
-                map_pixels_bordered[y_border_coords, x_border_coords] = MapUtils.get_border_color(node_color, darken_by=20)
+            for province in trade_node.provinces.values():
+                palette[province.province_id] = node_color
 
-        wasteland_pixels = set()
-        for province in self.world_data.areas.get("wasteland_area"):
-            if province.pixel_locations:
-                wasteland_pixels.update(province.pixel_locations)
+        map_pixels_borderless = self._paint_from_palette(palette)
+        map_pixels_bordered = map_pixels_borderless.copy()
 
-        x_wasteland_coords, y_wasteland_coords = zip(*wasteland_pixels)
+        node_borders = self._get_border_pixels(
+            "trade_node", (trade_node.provinces.values() for trade_node in world_nodes.values()))
+        self._paint_borders(map_pixels_bordered, node_borders, MapUtils.get_border_palette(palette, darken_by=20))
 
-        map_pixels_bordered[y_wasteland_coords, x_wasteland_coords] = ProvinceTypeColor.WASTELAND.value
-        map_pixels_borderless[y_wasteland_coords, x_wasteland_coords] = ProvinceTypeColor.WASTELAND.value
-
-        lake_pixels = set()
-        for province in self.world_data.areas.get("lake_area"):
-            if province.pixel_locations:
-                lake_pixels.update(province.pixel_locations)
-
-        x_lake_coords, y_lake_coords = zip(*lake_pixels)
-
-        map_pixels_bordered[y_lake_coords, x_lake_coords] = ProvinceTypeColor.SEA.value
-        map_pixels_borderless[y_lake_coords, x_lake_coords] = ProvinceTypeColor.SEA.value
+        self._paint_wasteland_and_lakes(map_pixels_bordered, map_pixels_borderless)
 
         return map_pixels_bordered, map_pixels_borderless
 
@@ -473,31 +712,11 @@ class MapPainter:
         """
         world_provinces = self.world_data.provinces
 
-        map_pixels_bordered = np.array(self._world_image)
-        map_pixels_borderless = map_pixels_bordered.copy()
-
-        province_type_colors = {
-            ProvinceType.SEA: ProvinceTypeColor.SEA.value,
-            ProvinceType.WASTELAND: ProvinceTypeColor.WASTELAND.value,
-        }
-
-        # Precompute pixel locations.
-        all_province_pixels = {
-            province.province_id: np.array(list(province.pixel_locations))
-            for province in world_provinces.values()}
-
-        all_province_border_pixels = {
-            province.province_id: np.array(list(province.border_pixels))
-            for province in world_provinces.values()}
-
+        palette = self._get_default_palette()
         for province in world_provinces.values():
-            province_pixels = all_province_pixels.get(province.province_id)
-            if province_pixels.size == 0:
-                continue
-
             province_type = province.province_type
-            if province_type in province_type_colors:
-                province_color = province_type_colors.get(province_type, None)
+            if province_type in self._TYPE_COLORS_UNINHABITED:
+                province_color = self._TYPE_COLORS_UNINHABITED.get(province_type, None)
             else:
                 province_culture = province.culture
                 if province_culture:
@@ -505,16 +724,13 @@ class MapPainter:
                 else:
                     province_color = MapUtils.seed_color(name="No Culture")
 
-            # Transpose (N, 2) array into `x` and `y` arrays for vectorized indexing.
-            x_coords, y_coords = province_pixels.T
+            palette[province.province_id] = province_color
 
-            map_pixels_bordered[y_coords, x_coords] = province_color
-            map_pixels_borderless[y_coords, x_coords] = province_color
+        map_pixels_borderless = self._paint_from_palette(palette)
+        map_pixels_bordered = map_pixels_borderless.copy()
 
-            border_pixels = all_province_border_pixels.get(province.province_id)
-            if border_pixels.size > 0:
-                x_border_coords, y_border_coords = border_pixels.T
-                map_pixels_bordered[y_border_coords, x_border_coords] = MapUtils.get_border_color(province_color, darken_by=15)
+        province_borders = self._get_border_pixels("province", ([province] for province in world_provinces.values()))
+        self._paint_borders(map_pixels_bordered, province_borders, MapUtils.get_border_palette(palette, darken_by=15))
 
         return map_pixels_bordered, map_pixels_borderless
 
@@ -533,31 +749,11 @@ class MapPainter:
         """
         world_provinces = self.world_data.provinces
 
-        map_pixels_bordered = np.array(self._world_image)
-        map_pixels_borderless = map_pixels_bordered.copy()
-
-        province_type_colors = {
-            ProvinceType.SEA: ProvinceTypeColor.SEA.value,
-            ProvinceType.WASTELAND: ProvinceTypeColor.WASTELAND.value,
-        }
-
-        # Precompute pixel locations.
-        all_province_pixels = {
-            province.province_id: np.array(list(province.pixel_locations))
-            for province in world_provinces.values()}
-
-        all_province_border_pixels = {
-            province.province_id: np.array(list(province.border_pixels))
-            for province in world_provinces.values()}
-
+        palette = self._get_default_palette()
         for province in world_provinces.values():
-            province_pixels = all_province_pixels.get(province.province_id)
-            if province_pixels.size == 0:
-                continue
-
             province_type = province.province_type
-            if province_type in province_type_colors:
-                province_color = province_type_colors.get(province_type, None)
+            if province_type in self._TYPE_COLORS_UNINHABITED:
+                province_color = self._TYPE_COLORS_UNINHABITED.get(province_type, None)
             else:
                 province_religion = province.religion
                 if province_religion:
@@ -565,15 +761,12 @@ class MapPainter:
                 else:
                     province_color = MapUtils.seed_color(name="No Religion")
 
-            # Transpose (N, 2) array into `x` and `y` arrays for vectorized indexing.
-            x_coords, y_coords = province_pixels.T
+            palette[province.province_id] = province_color
 
-            map_pixels_bordered[y_coords, x_coords] = province_color
-            map_pixels_borderless[y_coords, x_coords] = province_color
+        map_pixels_borderless = self._paint_from_palette(palette)
+        map_pixels_bordered = map_pixels_borderless.copy()
 
-            border_pixels = all_province_border_pixels.get(province.province_id)
-            if border_pixels.size > 0:
-                x_border_coords, y_border_coords = border_pixels.T
-                map_pixels_bordered[y_border_coords, x_border_coords] = MapUtils.get_border_color(province_color, darken_by=15)
+        province_borders = self._get_border_pixels("province", ([province] for province in world_provinces.values()))
+        self._paint_borders(map_pixels_bordered, province_borders, MapUtils.get_border_palette(palette, darken_by=15))
 
         return map_pixels_bordered, map_pixels_borderless
@@ -4,6 +4,8 @@ This module defines EUArea, which represents a collection of provinces in Europa
 
 
 
+import numpy as np
+
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -23,16 +25,18 @@ class EUArea(EUMapEntity):
         provinces (dict[int, EUProvince]): A mapping of province IDs to EUProvinces
             that belong to the area.
 
-        pixel_locations (set[tuple[int, int]]): The set of (x, y) coordinates occupied by the entity.
+        pixel_xs (np.ndarray): The `x` coordinates of the pixels occupied by the entity.
+        pixel_ys (np.ndarray): The `y` coordinates of the pixels occupied by the entity.
     """
     area_id: str
     provinces: dict[int, EUProvince]
 
-    pixel_locations: Optional[set[tuple[int, int]]] = field(init=False)
+    pixel_xs: Optional[np.ndarray] = field(init=False, repr=False, compare=False)
+    pixel_ys: Optional[np.ndarray] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Aggregate pixel locations from the contained provinces."""
-        self.pixel_locations = set(loc for province in self.provinces.values() for loc in province.pixel_locations)
+        self.pixel_xs, self.pixel_ys = self.concatenate_pixels(self.provinces.values())
         super().__post_init__()
 
     @classmethod
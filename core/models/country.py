@@ -4,6 +4,7 @@ Europa Universalis IV.
 """
 
 import importlib
+import numpy as np
 import re
 
 from dataclasses import dataclass, field
@@ -74,11 +75,12 @@ class EUCountry(EUMapEntity):
     subjects: Optional[set[str]] = None
     allies: Optional[set[str]] = None
 
-    pixel_locations: Optional[set[tuple[int, int]]] = field(init=False)
+    pixel_xs: Optional[np.ndarray] = field(init=False, repr=False, compare=False)
+    pixel_ys: Optional[np.ndarray] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Aggregate pixel locations from the contained provinces."""
-        self.pixel_locations = set(loc for province in self for loc in province.pixel_locations)
+        self.pixel_xs, self.pixel_ys = self.concatenate_pixels(self)
         super().__post_init__()
 
     @staticmethod
@@ -137,7 +139,7 @@ class EUCountry(EUMapEntity):
             except (ValueError, TypeError) as e:
                 print(f"Error converting {key} with value {value}: {e}")
 
-        if not self.pixel_locations:
+        if not self.pixel_xs.size:
             self.__post_init__()
 
         return self
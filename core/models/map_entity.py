@@ -1,6 +1,8 @@
+import numpy as np
+
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterable, Optional
 
 
 @dataclass
@@ -10,47 +12,63 @@ class EUMapEntity(ABC):
 
     Attributes:
         name (str): The name of the entity.
-        pixel_locations (set[tuple[int, int]]): The set of (x, y) coordinates occupied by the entity.
+        pixel_xs (np.ndarray): The `x` coordinates (int32) of the pixels occupied by the entity.
+        pixel_ys (np.ndarray): The `y` coordinates (int32) of the pixels occupied by the entity,
+            paired by index with `pixel_xs`.
 
-        border_pixels (set[tuple[int, int]]): The set of `(x, y)` tuples for the entity's border pixels.
-            Border pixels are those adjacent to areas not belonging to the entity.
         bounding_box (tuple[int, int, int, int]): The bounding box as `(min_x, max_x, min_y, max_y)`,
             representing the smallest rectangle enclosing the entity.
+        _pixel_indices (tuple[int, np.ndarray]|None): The map width and the pixels as flat 
+            `y * width + x` indices for it, built on first use by `get_pixel_indices()`.
     """
     name: str
-    pixel_locations: set[tuple[int, int]]
+    pixel_xs: np.ndarray = field(repr=False, compare=False)
+    pixel_ys: np.ndarray = field(repr=False, compare=False)
 
     # Will only ever be calculated in `__post_init__()`
-    border_pixels: Optional[set[tuple[int, int]]] = field(init=False)
     bounding_box: Optional[tuple[int, int, int, int]] = field(init=False)
+    _pixel_indices: Optional[tuple[int, np.ndarray]] = field(init=False, default=None, repr=False, compare=False)
 
     def __post_init__(self):
-        """Calculates bounding box and border pixels."""
-        self.border_pixels = self._calculate_border_pixels()
+        """Calculates the bounding box."""
         self.bounding_box = self._calculate_bounding_box()
 
-    def _calculate_border_pixels(self):
-        """The border pixels of a province.
+    @staticmethod
+    def concatenate_pixels(entities: Iterable["EUMapEntity"]):
+        """Joins the pixel locations of several entities, used to build aggregate entities.
+
+        Args:
+            entities (Iterable[EUMapEntity]): The entities to join.
 
-        Defined as pixels that are adjacent to other provinces (not in the same set).
-        
         Returns:
-            border (set[tuple[int, int]]): The set of `(x, y)` tuples for the border pixels.
+            pixels (tuple[np.ndarray, np.ndarray]): The joined `x` and `y` coordinates.
         """
-        border_pixels: set[tuple[int, int]] = set()
+        entities = list(entities)
+        if not entities:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+
+        pixel_xs = np.concatenate([entity.pixel_xs for entity in entities])
+        pixel_ys = np.concatenate([entity.pixel_ys for entity in entities])
+        return pixel_xs, pixel_ys
 
-        directions = [
-            (-1, 0), (1, 0), (0, -1), (0, 1),
-            (-1, -1), (-1, 1), (1, -1), (1, 1)]
+    def get_pixel_indices(self, map_width: int):
+        """Gets the pixels as indices into a flattened `(height * width)` map.
 
-        for (x, y) in self.pixel_locations:
-            for dx, dy in directions:
-                neighbor = (x + dx, y + dy)
-                if neighbor not in self.pixel_locations:
-                    border_pixels.add((x, y))
-                    break
+        The indices are sorted, so that scattering into the map writes memory in order. This 
+        matters for aggregate entities, whose pixels are joined province by province. The
+        indices are cached for the last `map_width` they were built for.
+
+        Args:
+            map_width (int): The width of the map image.
+
+        Returns:
+            np.ndarray: The sorted flat indices of the pixels.
+        """
+        if self._pixel_indices is None or self._pixel_indices[0] != map_width:
+            pixel_indices = np.sort(self.pixel_ys.astype(np.intp) * map_width + self.pixel_xs)
+            self._pixel_indices = (map_width, pixel_indices)
 
-        return border_pixels
+        return self._pixel_indices[1]
 
     def _calculate_bounding_box(self):
         """Gets the bounding box for the province.
@@ -60,11 +78,12 @@ class EUMapEntity(ABC):
         Returns:
             bounds (tuple[int, int, int, int]): The bounding box as `min_x`, `max_x`, `min_y`, `max_y`.
         """
-        if not self.pixel_locations:
+        if not self.pixel_xs.size:
             return None
 
-        x_values, y_values = zip(*self.pixel_locations)
-        return min(x_values), max(x_values), min(y_values), max(y_values)
+        return (
+            int(self.pixel_xs.min()), int(self.pixel_xs.max()),
+            int(self.pixel_ys.min()), int(self.pixel_ys.max()))
 
     @property
     def area_km2(self):
@@ -73,7 +92,7 @@ class EUMapEntity(ABC):
         map_width, map_height = 5632, 2304
         scale_factor = world_area_km2 / (map_width * map_height)
 
-        return round(len(self.pixel_locations) * scale_factor, 2)
+        return round(self.pixel_xs.size * scale_factor, 2)
 
     @property
     @abstractmethod
@@ -5,7 +5,7 @@ Europa Universalis IV.
 
 
 
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from math import floor
 from typing import Optional, get_type_hints
@@ -82,6 +82,10 @@ class EUProvince(EUMapEntity):
         native_hostileness (Optional[int]): The hostility of natives in the province.
             Represents the likelyhood of an uprising.
         patrol (Optional[int]): The number of game ticks it takes to patrol the province (only if it a sea province).
+
+        area (Optional[EUArea]): The area the province belongs to, set when the world is built.
+        region (Optional[EURegion]): The region the province belongs to, set when the world is built.
+        trade_node (Optional[EUTradeNode]): The trade node the province belongs to, set when the world is built.
     """
     province_id: int
     province_type: ProvinceType
@@ -108,6 +112,11 @@ class EUProvince(EUMapEntity):
     native_hostileness: Optional[int] = 0
     patrol: Optional[int] = None
 
+    # Typed as the base class, the concrete models import this module.
+    area: Optional[EUMapEntity] = field(default=None, repr=False, compare=False)
+    region: Optional[EUMapEntity] = field(default=None, repr=False, compare=False)
+    trade_node: Optional[EUMapEntity] = field(default=None, repr=False, compare=False)
+
     @classmethod
     def from_dict(cls, data: dict[str, str]):
         """Builds the province from a dictionary."""
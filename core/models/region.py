@@ -4,6 +4,8 @@ This module defines EURegion, which represents a collection of areas in Europa U
 
 
 
+import numpy as np
+
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -23,16 +25,18 @@ class EURegion(EUMapEntity):
         areas (dict[str, EUArea]): A mapping of area IDs to EUAreas
             that belong to the region.
 
-        pixel_locations (set[tuple[int, int]]): The set of (x, y) coordinates occupied by the entity.
+        pixel_xs (np.ndarray): The `x` coordinates of the pixels occupied by the entity.
+        pixel_ys (np.ndarray): The `y` coordinates of the pixels occupied by the entity.
     """
     region_id: str
     areas: dict[str, EUArea]
 
-    pixel_locations: Optional[set[tuple[int, int]]] = field(init=False)
+    pixel_xs: Optional[np.ndarray] = field(init=False, repr=False, compare=False)
+    pixel_ys: Optional[np.ndarray] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Aggregate pixel locations from the contained areas."""
-        self.pixel_locations = set(loc for area in self.areas.values() for loc in area.pixel_locations)
+        self.pixel_xs, self.pixel_ys = self.concatenate_pixels(self.areas.values())
         super().__post_init__()
 
     @classmethod
@@ -2,6 +2,8 @@
 This module defines EUTradeNode and EUTradeNodeParticipant, used for storing information relavent to trade nodes in Europa Universalis IV.
 """
 
+import numpy as np
+
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Optional, get_type_hints
@@ -135,7 +137,8 @@ class EUTradeNode(EUMapEntity):
         highest_trade_power (Optional[float]): The single highest trade power held by a country in this node.
         pulled_trade_power (Optional[float]): Trade power drawn from incoming nodes.
 
-        pixel_locations (Optional[set[tuple[int, int]]]): The set of (x, y) coordinates occupied by the trade node.
+        pixel_xs (Optional[np.ndarray]): The `x` coordinates of the pixels occupied by the trade node.
+        pixel_ys (Optional[np.ndarray]): The `y` coordinates of the pixels occupied by the trade node.
     """
     origin_number: int
     trade_node_id: str
@@ -160,13 +163,12 @@ class EUTradeNode(EUMapEntity):
     highest_trade_power: Optional[float] = 0.00
     pulled_trade_power: Optional[float] = 0.00
 
-    pixel_locations: Optional[set[tuple[int, int]]] = field(init=False)
+    pixel_xs: Optional[np.ndarray] = field(init=False, repr=False, compare=False)
+    pixel_ys: Optional[np.ndarray] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Aggregate pixel locations from the contained provinces."""
-        self.pixel_locations = set(
-            loc for province in self.provinces.values()
-            for loc in province.pixel_locations)
+        self.pixel_xs, self.pixel_ys = self.concatenate_pixels(self.provinces.values())
 
         super().__post_init__()
 
@@ -15,6 +15,9 @@ Methods:
 
 import colorsys
 import hashlib
+import numpy as np
+
+from functools import lru_cache
 from random import Random
 
 
@@ -94,11 +97,46 @@ class MapUtils:
         return tuple(max(0, c - darken_by) for c in color[:3])
 
     @staticmethod
+    def get_border_palette(palette: np.ndarray, darken_by: int=10):
+        """Generates the darker border color for every color of a palette at once.
+
+        Matches `get_border_color` applied to each row.
+
+        Args:
+            palette (np.ndarray): An `(N, 3)` uint8 array of RGB colors.
+            darken_by (int, optional): The amount to darken each RGB channel. Defaults to 10.
+
+        Returns:
+            np.ndarray: An `(N, 3)` uint8 array of the border colors.
+        """
+        darken_by = np.uint8(darken_by)
+        return np.maximum(palette, darken_by) - darken_by
+
+    @staticmethod
+    def pack_palette(palette: np.ndarray):
+        """Packs RGB colors into one 32 bit value each, laid out as RGBX bytes.
+
+        Painting with packed colors moves a whole pixel per element, and the result can be
+        viewed as an `(..., 4)` uint8 RGBX array without copying.
+
+        Args:
+            palette (np.ndarray): An `(N, 3)` uint8 array of RGB colors.
+
+        Returns:
+            np.ndarray: An `(N,)` uint32 array of the packed colors, with the padding byte set to 255.
+        """
+        packed = np.full((len(palette), 4), 255, dtype=np.uint8)
+        packed[:, :3] = palette
+        return packed.view(np.uint32).ravel()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
     def seed_color(name: str):
         """Generates a color based on the provided name.
 
         Hashes the input `name` string and uses the resulting hash 
         to produce a unique color, with a random hue, saturation, and brightness.
+        Results are memoized, as the same names are colored on every redraw.
 
         Args:
             name (str): The name used for generating the color.
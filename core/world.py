@@ -12,7 +12,7 @@ import numpy as np
 import os
 import re
 
-from collections import defaultdict, OrderedDict
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from PIL import Image
 from typing import Callable, Optional, Union
@@ -63,7 +63,10 @@ class EUWorldData:
 
         default_province_data (dict[int, dict[str, str]]): Default attributes for each province before modifications are loaded from a save file.
         current_province_data (dict[int, dict[str, str]]): Stores current province data, which updates as the game progresses.
-        province_locations (dict[int, set[tuple[int]]]): A mapping of province IDs to a set of pixel coordinates in the world image.
+        province_locations (dict[int, tuple[np.ndarray, np.ndarray]]): A mapping of province IDs to the `x` and `y` 
+            coordinates (int32 arrays) of their pixels in the world image.
+        province_id_map (np.ndarray): A `(height, width)` uint16 array of the province ID occupying each pixel
+            of the world image, or 0 where there is no province.
         default_area_data (dict[str, dict[str, str | set[int]]]): Default attributes for areas, including associated province IDs.
         default_region_data (dict[str, dict[str, str | set[str]]]): Default attributes for regions, including associated area names.
 
@@ -86,7 +89,8 @@ class EUWorldData:
 
         ## Default entity data.
         self.default_province_data: dict[int, dict[str, str]] = {}
-        self.province_locations: dict[int, set[tuple[int]]] = {}
+        self.province_locations: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        self.province_id_map: np.ndarray = None
         self.current_province_data: dict[int, dict[str, str]] = {}
         self.default_area_data: dict[str, dict[str, str|set[int]]] = {}
         self.default_region_data: dict[str, dict[str, str|set[str]]] = {}
@@ -113,7 +117,8 @@ class EUWorldData:
         world.default_province_data = world.load_world_provinces(savefile_lines=default_province_data_lines)
 
         world.world_image = world.load_world_image(maps_folder)
-        world.province_locations = world.get_province_pixel_locations(colors.default_province_colors)
+        world.province_id_map = world.get_province_id_map(colors.default_province_colors)
+        world.province_locations = world.get_province_pixel_locations()
 
         world.default_area_data = world.load_world_areas(maps_folder)
 
@@ -374,39 +379,67 @@ class EUWorldData:
             province_color_map (PIL.Image): The map image.
         """
         provinces_bmp_path = os.path.join(map_folder, "provinces.bmp")
-        province_colors_map = Image.open(provinces_bmp_path).convert("RGB")
-        return province_colors_map
+        with Image.open(provinces_bmp_path) as province_colors_map:
+            # The map is normally stored as RGB already, so avoid the extra full size copy.
+            if province_colors_map.mode != "RGB":
+                return province_colors_map.convert("RGB")
 
-    def get_province_pixel_locations(self, default_province_colors: dict[tuple[int, int, int], int]):
-        """Builds the pixel locations that are occupied by each province in the world.
-        
-        Each province has a unique color in the image, and by reading over the pixels, can get exactly
-        which pixels each province occupies.
+            province_colors_map.load()
+            return province_colors_map
+
+    def get_province_id_map(self, default_province_colors: dict[tuple[int, int, int], int]):
+        """Builds a map of the province ID occupying each pixel of the world image.
+
+        Each province has a unique color in the image. The colors are packed into 24 bit keys,
+        and every pixel is looked up at once in a table of the province ID of each key.
+        Province IDs fit in 16 bits, pixels without a province are left as 0.
 
         Args:
             default_province_colors (dict[tuple[int, int, int], int]): A mapping of colors to the owning province ID.
-            
+
         Returns:
-            dict[int, set[tuple[int, int]]]: A mapping of province IDs to a set of x, coords occupied by the province.
+            np.ndarray: The `(height, width)` uint16 province ID map.
         """
-        map_pixels = np.array(self.world_image)
-        height, width = map_pixels.shape[:2]
+        map_pixels = np.asarray(self.world_image)
+        packed_pixels = map_pixels[:, :, 0].astype(np.uint32) << 16
+        packed_pixels |= map_pixels[:, :, 1].astype(np.uint32) << 8
+        packed_pixels |= map_pixels[:, :, 2]
 
-        province_locations = defaultdict(set)
-        pixel_data = map_pixels[:, :, :3] # Only need the RGB channels.
-        flat = pixel_data.reshape((-1, 3)) # Flatten pixels for linear iteration.
+        colors = np.array(list(default_province_colors.keys()), dtype=np.uint32).reshape(-1, 3)
+        color_keys = (colors[:, 0] << 16) | (colors[:, 1] << 8) | colors[:, 2]
+        province_ids = np.zeros(1 << 24, dtype=np.uint16)
+        province_ids[color_keys] = list(default_province_colors.values())
 
-        for i, pixel in enumerate(flat):
-            pixel_tuple = tuple(pixel)
+        return province_ids[packed_pixels]
 
-            if pixel_tuple in default_province_colors:
-                province_id = default_province_colors[pixel_tuple]
-                # Convert flat array index back to 2D image coordinates for province mapping.
-                x = i % width
-                y = i // width
-                province_locations[province_id].add((x, y))
+    def get_province_pixel_locations(self):
+        """Builds the pixel locations that are occupied by each province in the world.
+        
+        The pixels of `province_id_map` are sorted by province ID, keeping each province's pixels
+        in row order, and split where the ID changes.
 
-        return dict(province_locations)
+        Returns:
+            dict[int, tuple[np.ndarray, np.ndarray]]: A mapping of province IDs to the `x` and `y` 
+                coordinates occupied by the province.
+        """
+        width = self.province_id_map.shape[1]
+        flat_ids = self.province_id_map.ravel()
+        pixel_indices = np.argsort(flat_ids, kind="stable")
+        sorted_ids = flat_ids[pixel_indices]
+
+        # Pixels without a province sort first.
+        first_mapped = np.searchsorted(sorted_ids, 1)
+        pixel_indices = pixel_indices[first_mapped:]
+        sorted_ids = sorted_ids[first_mapped:]
+        if not sorted_ids.size:
+            return {}
+
+        starts = np.flatnonzero(np.diff(sorted_ids)) + 1
+        province_ids = sorted_ids[np.concatenate(([0], starts))].tolist()
+        x_coords = np.split((pixel_indices % width).astype(np.int32), starts)
+        y_coords = np.split((pixel_indices // width).astype(np.int32), starts)
+
+        return dict(zip(province_ids, zip(x_coords, y_coords)))
 
     def load_world_areas(self, map_folder: str):
         """Builds the default **areas** dictionary from read game data.
@@ -566,7 +599,7 @@ class EUWorldData:
             for province_id, province_data in self.current_province_data.items():
                 pixel_locations = self.province_locations.get(province_id)
                 if pixel_locations:
-                    province_data["pixel_locations"] = pixel_locations
+                    province_data["pixel_xs"], province_data["pixel_ys"] = pixel_locations
                     futures.append(executor.submit(self._process_province, province_data))
 
             for future in as_completed(futures):
@@ -757,13 +790,15 @@ class EUWorldData:
                     for area_id, area_data in self.default_area_data.items()
                 ]
 
-            for future in as_completed(futures):
+            # In definition order, so a province listed in two areas always gets the same `area`.
+            for future in futures:
                 area = future.result()
                 self.areas[area.area_id] = area
 
             for area in self.areas.values():
-                for province_id in area.provinces:
+                for province_id, province in area.provinces.items():
                     self.province_to_area[province_id] = area
+                    province.area = area
 
     def _process_area(self, area_data: dict):
         """Helper method to process a single area from a `dict`.
@@ -789,14 +824,16 @@ class EUWorldData:
                     for region_id, region_data in self.default_region_data.items()
                 ]
 
-            for future in as_completed(futures):
+            # In definition order, so a province in areas of two regions always gets the same `region`.
+            for future in futures:
                 region = future.result()
                 self.regions[region.region_id] = region
 
             for region in self.regions.values():
                 for area in region:
-                    for province_id in area.provinces:
+                    for province_id, province in area.provinces.items():
                         self.province_to_region[province_id] = region
+                        province.region = region
 
     def _process_region(self, region_data: dict):
         """Helper method to process a single region.
@@ -1077,8 +1114,9 @@ class EUWorldData:
                 self.trade_nodes[trade_node.trade_node_id] = trade_node
 
             for trade_node in self.trade_nodes.values():
-                for province_id in trade_node.provinces:
+                for province_id, province in trade_node.provinces.items():
                     self.province_to_trade_node[province_id] = trade_node
+                    province.trade_node = trade_node
 
     def _process_trade_node(self, trade_node_data: dict):
         """Helper method to process a single trade node.